@@ -6,17 +6,59 @@ import threading
 import time
 import mimetypes
 import json
+import mmap
+import re
+import uuid
 from datetime import datetime
+from email.utils import formatdate
 
 # Configuration
 HOST = '127.0.0.1'  # localhost
 PORT = 8001  # Port for backend server 1
 BUFFER_SIZE = 4096
+MAX_RANGES = 16  # Range headers with more ranges are ignored
+RANGE_SPEC_RE = re.compile(r'([0-9]*)-([0-9]*)')  # ASCII digits only, unlike str.isdigit
+SLOW_REQUEST_THRESHOLD = None  # Seconds; log a phase breakdown for slower requests, None disables
 SERVER_NAME = "Backend-Server-1"  # Identifies which backend is responding
 
 # Define the directory where HTML files are stored
 DOCUMENT_ROOT = os.path.dirname(os.path.abspath(__file__))
 
+class PhaseTimer:
+    """Records how long each phase of handling a request takes"""
+    __slots__ = ('start', 'last', 'phases')
+
+    def __init__(self):
+        self.start = self.last = time.perf_counter()
+        self.phases = []
+
+    def mark(self, phase):
+        """End the current phase, naming it `phase`"""
+        now = time.perf_counter()
+        self.phases.append((phase, now - self.last))
+        self.last = now
+
+    def report_if_slow(self, uri):
+        """Log the phase breakdown if the request exceeded SLOW_REQUEST_THRESHOLD"""
+        total = time.perf_counter() - self.start
+        if total >= SLOW_REQUEST_THRESHOLD:
+            breakdown = ', '.join(f"{phase} {elapsed * 1000:.2f} ms" for phase, elapsed in self.phases)
+            print(f"[{SERVER_NAME}] Slow request {uri}: {total * 1000:.2f} ms ({breakdown})")
+
+
+class NullTimer:
+    """Stand-in for PhaseTimer when slow request logging is disabled"""
+    __slots__ = ()
+
+    def mark(self, phase):
+        pass
+
+    def report_if_slow(self, uri):
+        pass
+
+
+NULL_TIMER = NullTimer()
+
 def get_content_type(file_path):
     """Determine content type based on file extension"""
     content_type, _ = mimetypes.guess_type(file_path)
@@ -24,6 +66,124 @@ def get_content_type(file_path):
         return content_type
     return 'application/octet-stream'  # Default content type
 
+def parse_headers(request_data):
+    """Parse request headers into a dict keyed by lower-cased header name"""
+    headers = {}
+    for line in request_data.split('\r\n')[1:]:
+        if not line:
+            break
+        key, sep, value = line.partition(':')
+        if sep:
+            headers[key.strip().lower()] = value.strip()
+    return headers
+
+def parse_range_header(range_header, size):
+    """Parse a Range header into (start, end) byte positions, both inclusive
+    
+    Returns None if the header is malformed or should be ignored, in which
+    case the full file is served, and [] if no range can be satisfied.
+    """
+    unit, sep, spec = range_header.partition('=')
+    if not sep or unit.strip().lower() != 'bytes':
+        return None
+    specs = spec.split(',')
+    if len(specs) > MAX_RANGES:
+        return None
+    
+    ranges = []
+    for part in specs:
+        match = RANGE_SPEC_RE.fullmatch(part.strip())
+        if not match or not any(match.groups()):
+            return None
+        first, last = match.groups()
+        
+        if not first:
+            # Suffix range: the last N bytes
+            length = int(last)
+            if length == 0:
+                continue
+            start, end = max(size - length, 0), size - 1
+        else:
+            start = int(first)
+            end = size - 1
+            if last:
+                if int(last) < start:
+                    return None
+                end = min(int(last), end)
+        
+        if start < size:
+            ranges.append((start, end))
+    return ranges
+
+def if_range_matches(if_range, etag, last_modified):
+    """Check an If-Range validator against the file's ETag or Last-Modified"""
+    if if_range is None:
+        return True
+    if if_range.startswith('W/'):
+        # Weak validators never match for If-Range
+        return False
+    if if_range.startswith('"'):
+        return if_range == etag
+    return if_range == last_modified
+
+def send_file(client_socket, mapped, ranges, file_size, content_type, etag, last_modified):
+    """Send a whole file, or the requested byte ranges of it, from an mmap
+    
+    Body pieces are memoryview slices of the mapping, so the file is never
+    copied into memory. `mapped` is None for an empty file and `ranges` is
+    None for a full 200 response.
+    """
+    view = memoryview(mapped) if mapped is not None else memoryview(b'')
+    
+    if ranges is None:
+        status = "200 OK"
+        pieces = [view]
+        range_headers = f"Content-Type: {content_type}\r\n"
+    elif len(ranges) == 1:
+        start, end = ranges[0]
+        status = "206 Partial Content"
+        pieces = [view[start:end + 1]]
+        range_headers = f"Content-Type: {content_type}\r\n"
+        range_headers += f"Content-Range: bytes {start}-{end}/{file_size}\r\n"
+    else:
+        # Several ranges are sent as multipart/byteranges
+        boundary = uuid.uuid4().hex
+        status = "206 Partial Content"
+        pieces = []
+        for start, end in ranges:
+            pieces.append(
+                f"\r\n--{boundary}\r\nContent-Type: {content_type}\r\n"
+                f"Content-Range: bytes {start}-{end}/{file_size}\r\n\r\n".encode()
+            )
+            pieces.append(view[start:end + 1])
+        pieces.append(f"\r\n--{boundary}--\r\n".encode())
+        range_headers = f"Content-Type: multipart/byteranges; boundary={boundary}\r\n"
+    
+    # Create HTTP response header
+    response_header = f"HTTP/1.1 {status}\r\n"
+    response_header += range_headers
+    response_header += f"Content-Length: {sum(len(piece) for piece in pieces)}\r\n"
+    response_header += "Accept-Ranges: bytes\r\n"
+    response_header += f"ETag: {etag}\r\n"
+    response_header += f"Last-Modified: {last_modified}\r\n"
+    response_header += f"Server: {SERVER_NAME}\r\n"  # Add server identifier
+    response_header += f"Date: {datetime.now().strftime('%a, %d %b %Y %H:%M:%S GMT')}\r\n"
+    response_header += "Connection: close\r\n\r\n"
+    
+    # Send the header, then the file content
+    client_socket.sendall(response_header.encode())
+    for piece in pieces:
+        client_socket.sendall(piece)
+
+def range_not_satisfiable_response(file_size):
+    """Create a 416 response for a Range header that matches no bytes"""
+    response = "HTTP/1.1 416 Range Not Satisfiable\r\n"
+    response += f"Content-Range: bytes */{file_size}\r\n"
+    response += "Content-Length: 0\r\n"
+    response += f"Server: {SERVER_NAME}\r\n"
+    response += "Connection: close\r\n\r\n"
+    return response.encode()
+
 def handle_api_request(uri):
     """Handle API requests and return appropriate response"""
     if uri == '/proxy-cgi/trace':
@@ -55,21 +215,28 @@ def handle_api_request(uri):
 def handle_client(client_socket, client_address):
     """Handle client connections"""
     print(f"[{SERVER_NAME}] Connection from {client_address}")
+    timer = PhaseTimer() if SLOW_REQUEST_THRESHOLD is not None else NULL_TIMER
+    uri = None
+    mapped = None
     
     try:
         # Receive the HTTP request
         request_data = client_socket.recv(BUFFER_SIZE).decode('utf-8')
+        timer.mark('recv')
         if not request_data:
             return
         
         # Parse the first line of the HTTP request: METHOD URI HTTP_VERSION
         request_line = request_data.split('\n')[0]
         method, uri, _ = request_line.split()
+        headers = parse_headers(request_data)
         
         # Check if this is an Trace request
         api_response = handle_api_request(uri)
+        timer.mark('parse_request')
         if api_response:
             client_socket.sendall(api_response)
+            timer.mark('sendall')
             print(f"[{SERVER_NAME}] Trace Info: {uri}")
             return
         
@@ -82,28 +249,40 @@ def handle_client(client_socket, client_address):
         
         # Check if file exists and serve it
         if os.path.isfile(file_path):
-            # Get the file size
-            file_size = os.path.getsize(file_path)
+            # Get the file size and validators for If-Range
+            file_stat = os.stat(file_path)
+            file_size = file_stat.st_size
+            etag = f'"{file_stat.st_mtime_ns:x}-{file_size:x}"'
+            last_modified = formatdate(file_stat.st_mtime, usegmt=True)
             
             # Determine content type
             content_type = get_content_type(file_path)
             
-            # Create HTTP response header
-            response_header = f"HTTP/1.1 200 OK\r\n"
-            response_header += f"Content-Type: {content_type}\r\n"
-            response_header += f"Content-Length: {file_size}\r\n"
-            response_header += f"Server: {SERVER_NAME}\r\n"  # Add server identifier
-            response_header += f"Date: {datetime.now().strftime('%a, %d %b %Y %H:%M:%S GMT')}\r\n"
-            response_header += "Connection: close\r\n\r\n"
+            # Only honour Range while If-Range (if given) still matches the file
+            ranges = None
+            if 'range' in headers and if_range_matches(headers.get('if-range'), etag, last_modified):
+                ranges = parse_range_header(headers['range'], file_size)
+            timer.mark('stat')
+            
+            if ranges == []:
+                client_socket.sendall(range_not_satisfiable_response(file_size))
+                timer.mark('sendall')
+                print(f"[{SERVER_NAME}] 416 Range Not Satisfiable: {file_path} ({headers['range']})")
+                return
+            
+            # Map the file instead of reading it, only the pages sent are touched
+            if file_size:
+                with open(file_path, 'rb') as file:
+                    mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            timer.mark('mmap')
             
-            # Send the header
-            client_socket.sendall(response_header.encode())
+            send_file(client_socket, mapped, ranges, file_size, content_type, etag, last_modified)
+            timer.mark('sendall')
             
-            # Send the file content
-            with open(file_path, 'rb') as file:
-                client_socket.sendall(file.read())
-                
-            print(f"[{SERVER_NAME}] Served: {file_path}")
+            if ranges:
+                print(f"[{SERVER_NAME}] Served {len(ranges)} range(s): {file_path} ({headers['range']})")
+            else:
+                print(f"[{SERVER_NAME}] Served: {file_path}")
             
         else:
             # File not found - send 404 response
@@ -118,6 +297,7 @@ def handle_client(client_socket, client_address):
             response += f"</body>\r\n</html>"
             
             client_socket.sendall(response.encode())
+            timer.mark('sendall')
             print(f"[{SERVER_NAME}] 404 Not Found: {file_path}")
     
     except Exception as e:
@@ -125,6 +305,12 @@ def handle_client(client_socket, client_address):
     
     finally:
         client_socket.close()
+        # send_file's memoryviews are released by now, so the mapping can close
+        if mapped is not None:
+            mapped.close()
+        # Connections without a request are availability probes
+        if uri is not None:
+            timer.report_if_slow(uri)
 
 def start_server():
     """Start the web server"""
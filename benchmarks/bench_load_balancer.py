@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""Microbenchmarks for the load balancer request/response hot path.
+
+Run from the repository root:
+
+    python benchmarks/bench_load_balancer.py
+"""
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import load_balancer  # noqa: E402
+
+load_balancer.DEBUG = False  # Benchmark the fast path, not the debug logging
+
+NUMBER = 10000  # Calls per measurement
+REPEAT = 5  # Measurements per benchmark, best one is reported
+
+REQUEST = (
+    b"GET /helloworld.html?lang=en HTTP/1.1\r\n"
+    b"Host: localhost:8000\r\n"
+    b"User-Agent: Mozilla/5.0 (X11; Linux x86_64)\r\n"
+    b"Accept: text/html,application/xhtml+xml\r\n"
+    b"Accept-Encoding: gzip, deflate\r\n"
+    b"Cookie: theme=dark; sticky_backend=127.0.0.1:8001; session=abc123\r\n"
+    b"Connection: keep-alive\r\n"
+    b"\r\n"
+)
+
+RESPONSE_HEADER = (
+    b"HTTP/1.1 200 OK\r\n"
+    b"Content-Type: application/octet-stream\r\n"
+    b"Server: Backend-Server-1\r\n"
+    b"Connection: close\r\n"
+    b"\r\n"
+)
+
+
+class NullSocket:
+    """Socket stand-in that accepts every byte, to time only our own code."""
+
+    def sendall(self, data):
+        pass
+
+    def sendmsg(self, buffers):
+        return sum(len(buffer) for buffer in buffers)
+
+
+def bench(name, stmt):
+    """Run one benchmark and print the best time per call."""
+    best = min(timeit.repeat(stmt, number=NUMBER, repeat=REPEAT))
+    print(f"{name:<45} {best / NUMBER * 1e6:8.2f} us/call")
+
+
+def main():
+    lb = load_balancer.LoadBalancer(load_balancer.HOST, load_balancer.PORT,
+                                    load_balancer.BACKEND_SERVERS)
+    request = lb.parse_request_head(REQUEST)
+    backend = load_balancer.BACKEND_SERVERS[0]
+    conn = NullSocket()
+
+    bench("parse_request", lambda: lb.parse_request(REQUEST))
+    bench("parse_request_head", lambda: lb.parse_request_head(REQUEST))
+    bench("get_backend_from_cookie (cached)",
+          lambda: lb.get_backend_from_cookie(request.headers, request.cookies))
+
+    for size in (1024, 1024 * 1024):
+        response = RESPONSE_HEADER + b"x" * size
+        label = f"{size // 1024} KiB body"
+        bench(f"is_success_response ({label})", lambda: lb.is_success_response(response))
+        bench(f"add_cookie_header ({label})", lambda: lb.add_cookie_header(response, backend))
+        bench(f"cookie_header_segments + send ({label})",
+              lambda: lb.send_segments(conn, lb.cookie_header_segments(response, backend)))
+
+
+if __name__ == '__main__':
+    main()
@@ -4,6 +4,14 @@ import os
 import sys
 import time
 import re
+import json
+import signal
+import subprocess
+import cProfile
+import pstats
+import mmap
+import select
+import tempfile
 from urllib.parse import urlparse
 import uuid  # Add this for unique cache keys
 import errno
@@ -12,6 +20,8 @@ import errno
 HOST = '127.0.0.1'  # Localhost
 PORT = 8000  # Port to listen on
 BUFFER_SIZE = 4096  # Socket buffer size
+STREAM_BUFFER_SIZE = 65536  # Chunk size when relaying backend responses
+MAX_RESPONSE_HEAD = 65536  # Max bytes read from a backend before streaming starts
 TIMEOUT = 5  # Socket timeout in seconds
 
 # Backend servers configuration
@@ -29,51 +39,609 @@ NO_CACHE_ENDPOINTS = [
     '/proxy-cgi/trace'
 ]
 
+# Graceful shutdown and reload
+CONFIG_FILE = os.environ.get(
+    'LB_CONFIG',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), 'load_balancer.json')
+)
+DRAIN_TIMEOUT = 10  # Max seconds spent draining queued connections on shutdown
+ACCEPT_POLL_INTERVAL = 0.5  # How often the accept loop checks for signals
+HANDOFF_TIMEOUT = 10  # Max seconds to wait for a new process to report it is serving
+LISTEN_FD_ENV = 'LB_LISTEN_FD'  # Set when a listening socket is handed to a new process
+READY_FD_ENV = 'LB_READY_FD'  # Pipe the new process writes to once it is serving
+
+# Profiling and timing
+SLOW_REQUEST_THRESHOLD = None  # Seconds; log a phase breakdown for slower requests, None disables
+PROFILE_SECONDS = 10  # Length of the profiling window started by SIGUSR1
+PROFILE_DIR = "profiles"  # Where profiling reports are written
+PROFILE_LIMIT = 50  # Number of functions listed in a profiling report
+
+# Request parsing
+HEADER_TERMINATOR = b'\r\n\r\n'
+MAX_STATUS_LINE = 1024  # Only this many bytes are scanned for the status line
+COOKIE_CACHE_SIZE = 256  # Max number of cached sticky cookie values
+MAX_RANGES = 16  # Range headers with more ranges are ignored
+RANGE_SPEC_RE = re.compile(r'([0-9]*)-([0-9]*)')  # ASCII digits only, unlike str.isdigit
+REQUEST_LINE_RE = re.compile(rb'([A-Z]+) +(\S+) +(HTTP/\d\.\d) *')
+
 # Ensure cache directory exists
 if not os.path.exists(CACHE_DIR):
     os.makedirs(CACHE_DIR)
 
+
+def parse_port(value):
+    """Validate a TCP port number from the config file."""
+    port = int(value)
+    if not 0 <= port <= 65535:
+        raise ValueError(f"port must be between 0 and 65535, got {port}")
+    return port
+
+
+def parse_backend_servers(value):
+    """Validate a list of [host, port] pairs from the config file."""
+    backends = [(str(host), parse_port(port)) for host, port in value]
+    if not backends:
+        raise ValueError("backend_servers must not be empty")
+    return backends
+
+
+def parse_positive_int(value):
+    """Validate a whole number greater than zero from the config file."""
+    number = int(value)
+    if number <= 0:
+        raise ValueError(f"must be greater than 0, got {number}")
+    return number
+
+
+def parse_positive_float(value):
+    """Validate a finite number greater than zero from the config file."""
+    number = float(value)
+    # Also rejects NaN, which fails every comparison
+    if not 0 < number < float('inf'):
+        raise ValueError(f"must be a finite number greater than 0, got {number}")
+    return number
+
+
+def parse_optional_float(value):
+    """Validate a non-negative number or null from the config file."""
+    if value is None:
+        return None
+    number = float(value)
+    if not 0 <= number < float('inf'):
+        raise ValueError(f"must be a finite number of at least 0, got {number}")
+    return number
+
+
+def parse_bool(value):
+    """Validate a JSON boolean from the config file."""
+    if not isinstance(value, bool):
+        raise ValueError(f"expected true or false, got {value!r}")
+    return value
+
+
+# Config file key -> (module setting, converter)
+CONFIG_KEYS = {
+    'host': ('HOST', str),
+    'port': ('PORT', parse_port),
+    'buffer_size': ('BUFFER_SIZE', parse_positive_int),
+    'timeout': ('TIMEOUT', parse_positive_float),
+    'drain_timeout': ('DRAIN_TIMEOUT', parse_positive_float),
+    'handoff_timeout': ('HANDOFF_TIMEOUT', parse_positive_float),
+    'backend_servers': ('BACKEND_SERVERS', parse_backend_servers),
+    'no_cache_endpoints': ('NO_CACHE_ENDPOINTS', lambda value: [str(path) for path in value]),
+    'debug': ('DEBUG', parse_bool),
+    'slow_request_threshold': ('SLOW_REQUEST_THRESHOLD', parse_optional_float),
+    'profile_seconds': ('PROFILE_SECONDS', parse_positive_float),
+    'profile_dir': ('PROFILE_DIR', str),
+}
+
+
+def load_config(path):
+    """Load and validate a JSON config file into a dict of module settings.
+    
+    Raises OSError if the file can't be read and ValueError if it is invalid.
+    """
+    with open(path) as f:
+        raw = json.load(f)
+    if not isinstance(raw, dict):
+        raise ValueError("config must be a JSON object")
+    
+    config = {}
+    for key, value in raw.items():
+        if key not in CONFIG_KEYS:
+            raise ValueError(f"unknown config key: {key}")
+        name, convert = CONFIG_KEYS[key]
+        try:
+            config[name] = convert(value)
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"invalid value for {key}: {e}")
+    return config
+
+
+# Settings as defined above, restored for keys a reloaded config file leaves out
+CONFIG_DEFAULTS = {name: globals()[name] for name, _ in CONFIG_KEYS.values()}
+
+
+def apply_config(config):
+    """Replace the module settings with values from load_config.
+    
+    Settings missing from `config` go back to their defaults, so removing a
+    key from the file and reloading undoes it.
+    """
+    globals().update({**CONFIG_DEFAULTS, **config})
+
+
+def parse_cookie_header(cookie_header):
+    """Parse a Cookie header value into a dict (first occurrence wins)."""
+    cookies = {}
+    for cookie in cookie_header.split(';'):
+        name, sep, value = cookie.strip().partition('=')
+        if sep and name not in cookies:
+            cookies[name] = value
+    return cookies
+
+
+def parse_range_header(range_header, size):
+    """Parse a Range header into (start, end) byte positions, both inclusive.
+    
+    Returns None if the header is malformed or should be ignored, in which
+    case the full object is served, and [] if no range can be satisfied.
+    """
+    unit, sep, spec = range_header.partition('=')
+    if not sep or unit.strip().lower() != 'bytes':
+        return None
+    specs = spec.split(',')
+    if len(specs) > MAX_RANGES:
+        return None
+    
+    ranges = []
+    for part in specs:
+        match = RANGE_SPEC_RE.fullmatch(part.strip())
+        if not match or not any(match.groups()):
+            return None
+        first, last = match.groups()
+        
+        if not first:
+            # Suffix range: the last N bytes
+            length = int(last)
+            if length == 0:
+                continue
+            start, end = max(size - length, 0), size - 1
+        else:
+            start = int(first)
+            end = size - 1
+            if last:
+                if int(last) < start:
+                    return None
+                end = min(int(last), end)
+        
+        if start < size:
+            ranges.append((start, end))
+    return ranges
+
+
+def if_range_matches(if_range, etag, last_modified):
+    """Check an If-Range validator against the ETag or Last-Modified of an object."""
+    if if_range is None:
+        return True
+    if if_range.startswith('W/'):
+        # Weak validators never match for If-Range
+        return False
+    if if_range.startswith('"'):
+        return if_range == etag
+    return if_range == last_modified
+
+
+def status_line_of(response_data):
+    """Return the status line of a raw response without splitting the rest."""
+    line_end = response_data.find(b'\r\n', 0, MAX_STATUS_LINE)
+    if line_end == -1:
+        return response_data[:MAX_STATUS_LINE]
+    return response_data[:line_end]
+
+
+class PhaseTimer:
+    """Records how long each phase of handling a request takes."""
+    __slots__ = ('start', 'last', 'phases')
+
+    def __init__(self):
+        self.start = self.last = time.perf_counter()
+        self.phases = []
+
+    def mark(self, phase):
+        """End the current phase, naming it `phase`."""
+        now = time.perf_counter()
+        self.phases.append((phase, now - self.last))
+        self.last = now
+
+    def add_phases(self, phases):
+        """Record (phase, seconds) pairs measured elsewhere, ending now.
+
+        Used where phases interleave, e.g. reading and sending chunk by chunk.
+        """
+        self.phases.extend(phases)
+        self.last = time.perf_counter()
+
+    def report_if_slow(self, path):
+        """Log the phase breakdown if the request exceeded SLOW_REQUEST_THRESHOLD."""
+        total = time.perf_counter() - self.start
+        if total >= SLOW_REQUEST_THRESHOLD:
+            breakdown = ', '.join(f"{phase} {elapsed * 1000:.2f} ms" for phase, elapsed in self.phases)
+            print(f"Slow request {path}: {total * 1000:.2f} ms ({breakdown})")
+
+
+class NullTimer:
+    """Stand-in for PhaseTimer when slow request logging is disabled."""
+    __slots__ = ()
+
+    def mark(self, phase):
+        pass
+
+    def add_phases(self, phases):
+        pass
+
+    def report_if_slow(self, path):
+        pass
+
+
+NULL_TIMER = NullTimer()
+
+
+class HTTPRequest:
+    """Request line, headers and cookies of a raw HTTP request.
+
+    Only the header block is decoded; the body stays in `raw` and is
+    exposed through `body` as a memoryview so it is never copied.
+    """
+    __slots__ = ('method', 'uri', 'path', 'protocol', 'headers', 'header_index',
+                 'cookies', 'raw', 'header_end')
+
+    def __init__(self, method, uri, path, protocol, headers, cookies, raw, header_end):
+        self.method = method
+        self.uri = uri
+        self.path = path
+        self.protocol = protocol
+        self.headers = headers
+        # Header names are case-insensitive, `headers` keeps them as sent
+        self.header_index = {key.lower(): value for key, value in headers.items()}
+        self.cookies = cookies
+        self.raw = raw
+        self.header_end = header_end
+
+    def header(self, name, default=None):
+        """Look up a header value by case-insensitive name."""
+        return self.header_index.get(name.lower(), default)
+
+    @property
+    def body(self):
+        """Request body as a zero-copy view of the raw data."""
+        if self.header_end == -1:
+            return memoryview(b'')
+        return memoryview(self.raw)[self.header_end + len(HEADER_TERMINATOR):]
+
+    @classmethod
+    def parse(cls, data):
+        """Parse raw request bytes, returning None if the request line is invalid."""
+        header_end = data.find(HEADER_TERMINATOR)
+        head = data if header_end == -1 else data[:header_end]
+
+        line_end = head.find(b'\r\n')
+        request_line = head if line_end == -1 else head[:line_end]
+        match = REQUEST_LINE_RE.fullmatch(request_line)
+        if not match:
+            return None
+
+        method, uri, protocol = (part.decode('latin-1') for part in match.groups())
+
+        # Origin-form URIs are by far the most common, so avoid urlparse for them
+        if uri.startswith('/') and not uri.startswith('//') and ';' not in uri:
+            path = uri.partition('?')[0].partition('#')[0]
+        else:
+            path = urlparse(uri).path
+        path = path or '/'
+
+        headers = {}
+        if line_end != -1:
+            for line in head[line_end + 2:].decode('latin-1').split('\r\n'):
+                if not line:
+                    break
+                key, sep, value = line.partition(':')
+                if sep:
+                    headers[key.strip()] = value.strip()
+
+        request = cls(method, uri, path, protocol, headers, {}, data, header_end)
+        cookie_header = request.header('Cookie')
+        if cookie_header is not None:
+            request.cookies = parse_cookie_header(cookie_header)
+        return request
+
+
 class LoadBalancer:
-    def __init__(self, host, port, backend_servers):
+    def __init__(self, host, port, backend_servers, config_file=CONFIG_FILE):
         """Initialize the load balancer with host, port, and backend servers."""
         self.host = host
         self.port = port
         self.backend_servers = backend_servers
+        self.config_file = config_file
         self.current_backend_index = 0
+        self.cookie_backends = {}  # Sticky cookie value -> backend tuple
+        self.cookie_lines = {}  # Backend tuple -> encoded Set-Cookie line
+        
+        # Set from signal handlers, acted on between requests
+        self.reload_requested = False
+        self.shutdown_requested = False
+        self.handoff_requested = False
+        self.profile_requested = False
+        
+        # Active cProfile window, if any
+        self.profiler = None
+        self.profile_deadline = 0
         
     def start(self):
         """Start the load balancer server."""
-        server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.install_signal_handlers()
+        server_socket = self.open_listening_socket()
+        self.notify_ready()
+        handed_off = False
         
         try:
-            server_socket.bind((self.host, self.port))
-            server_socket.listen(5)
             print(f"Load balancer running on {self.host}:{self.port}")
             print(f"Backend servers: {self.backend_servers}")
             
-            while True:
-                client_conn, client_addr = server_socket.accept()
+            while not self.shutdown_requested:
+                if self.profile_requested:
+                    self.profile_requested = False
+                    print(f"Received SIGUSR1, profiling for {PROFILE_SECONDS} seconds")
+                    self.start_profiling()
+                if self.profiler is not None and time.monotonic() >= self.profile_deadline:
+                    self.stop_profiling()
+                
+                if self.reload_requested:
+                    self.reload_requested = False
+                    print("Received SIGHUP, reloading config")
+                    server_socket = self.reload_config(server_socket)
+                
+                if self.handoff_requested:
+                    self.handoff_requested = False
+                    print("Received SIGUSR2, handing off listening socket")
+                    if self.hand_off(server_socket):
+                        handed_off = True
+                        break
+                
+                try:
+                    client_conn, client_addr = server_socket.accept()
+                except socket.timeout:
+                    continue
                 print(f"Connection from {client_addr}")
                 self.handle_client(client_conn)
+            
+            # The new process accepts whatever is queued after a handoff
+            if not handed_off:
+                print("Received SIGTERM, draining queued connections before shutting down")
+                self.drain(server_socket)
                 
         except KeyboardInterrupt:
             print("Shutting down load balancer...")
         finally:
+            if self.profiler is not None:
+                self.stop_profiling()
             server_socket.close()
+    
+    def install_signal_handlers(self):
+        """Reload on SIGHUP, drain and exit on SIGTERM, hand off on SIGUSR2,
+        profile on SIGUSR1."""
+        handlers = {
+            'SIGHUP': self.request_reload,
+            'SIGTERM': self.request_shutdown,
+            'SIGUSR1': self.request_profile,
+            'SIGUSR2': self.request_handoff,
+        }
+        # Not every signal exists on every platform (e.g. Windows)
+        for name, handler in handlers.items():
+            if hasattr(signal, name):
+                signal.signal(getattr(signal, name), handler)
+    
+    # Signal handlers only set flags. Printing from them could re-enter a
+    # print() already in progress on stdout, which raises RuntimeError;
+    # the accept loop logs when it acts on the flags instead.
+    
+    def request_reload(self, signum, frame):
+        """Signal handler: reload the config file after the current request."""
+        self.reload_requested = True
+    
+    def request_shutdown(self, signum, frame):
+        """Signal handler: stop accepting and drain after the current request."""
+        self.shutdown_requested = True
+    
+    def request_handoff(self, signum, frame):
+        """Signal handler: hand the listening socket to a new process."""
+        self.handoff_requested = True
+    
+    def request_profile(self, signum, frame):
+        """Signal handler: profile the load balancer for PROFILE_SECONDS."""
+        self.profile_requested = True
+    
+    def start_profiling(self):
+        """Start a cProfile window, unless one is already running."""
+        if self.profiler is not None:
+            print("Profiling already in progress")
+            return
+        self.profiler = cProfile.Profile()
+        self.profile_deadline = time.monotonic() + PROFILE_SECONDS
+        self.profiler.enable()
+    
+    def stop_profiling(self):
+        """Stop the cProfile window and write its report to PROFILE_DIR."""
+        profiler, self.profiler = self.profiler, None
+        profiler.disable()
+        try:
+            os.makedirs(PROFILE_DIR, exist_ok=True)
+            report_file = os.path.join(
+                PROFILE_DIR, f"profile-{os.getpid()}-{time.strftime('%Y%m%d-%H%M%S')}.txt"
+            )
+            with open(report_file, 'w') as f:
+                stats = pstats.Stats(profiler, stream=f)
+                stats.sort_stats('cumulative').print_stats(PROFILE_LIMIT)
+            print(f"Profiling report written to {report_file}")
+        except OSError as e:
+            print(f"Error writing profiling report: {e}")
+    
+    def bind_listening_socket(self, host, port):
+        """Create a listening socket bound to host and port."""
+        server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        try:
+            server_socket.bind((host, port))
+            server_socket.listen(5)
+        except OSError:
+            server_socket.close()
+            raise
+        # Use a timeout so the accept loop can act on signals
+        server_socket.settimeout(ACCEPT_POLL_INTERVAL)
+        return server_socket
+    
+    def open_listening_socket(self):
+        """Inherit the listening socket from a previous process, or bind a new one."""
+        inherited_fd = os.environ.pop(LISTEN_FD_ENV, None)
+        if inherited_fd is None:
+            return self.bind_listening_socket(self.host, self.port)
+        
+        server_socket = socket.socket(fileno=int(inherited_fd))
+        server_socket.settimeout(ACCEPT_POLL_INTERVAL)
+        self.host, self.port = server_socket.getsockname()[:2]
+        print(f"Inherited listening socket on {self.host}:{self.port}")
+        return server_socket
+    
+    def notify_ready(self):
+        """Tell the process that handed off the listening socket that we are serving."""
+        ready_fd = os.environ.pop(READY_FD_ENV, None)
+        if ready_fd is None:
+            return
+        try:
+            os.write(int(ready_fd), b'1')
+        except OSError as e:
+            print(f"Error reporting readiness: {e}")
+        finally:
+            os.close(int(ready_fd))
+    
+    def reload_config(self, server_socket):
+        """Reload the config file, rebinding if the listen address changed.
+        
+        Returns the listening socket to use from now on. On any error the
+        current config and socket are kept.
+        """
+        try:
+            config = load_config(self.config_file)
+        except (OSError, ValueError) as e:
+            print(f"Config reload failed, keeping current config: {e}")
+            return server_socket
+        
+        new_host = config.get('HOST', CONFIG_DEFAULTS['HOST'])
+        new_port = config.get('PORT', CONFIG_DEFAULTS['PORT'])
+        if (new_host, new_port) != (self.host, self.port):
+            try:
+                new_socket = self.bind_listening_socket(new_host, new_port)
+            except (OSError, OverflowError) as e:
+                print(f"Cannot listen on {new_host}:{new_port}, keeping current config: {e}")
+                return server_socket
+            # Serve what is already queued on the old address before closing it
+            self.drain(server_socket)
+            server_socket.close()
+            server_socket = new_socket
+            self.host, self.port = new_host, new_port
+            print(f"Load balancer now listening on {self.host}:{self.port}")
+        
+        apply_config(config)
+        self.backend_servers = BACKEND_SERVERS
+        self.current_backend_index %= len(self.backend_servers)
+        # Cached cookie lookups may point at backends that were removed
+        self.cookie_backends.clear()
+        self.cookie_lines.clear()
+        print(f"Config reloaded from {self.config_file}")
+        print(f"Backend servers: {self.backend_servers}")
+        return server_socket
+    
+    def hand_off(self, server_socket):
+        """Start a new load balancer process that inherits the listening socket.
+        
+        Returns True once the new process reports it is serving and this one
+        should exit. If it fails to start, exits, or doesn't report ready
+        within HANDOFF_TIMEOUT, it is killed and this process keeps serving.
+        """
+        # The new process would exit on a config file we can't load
+        if os.path.exists(self.config_file):
+            try:
+                load_config(self.config_file)
+            except (OSError, ValueError) as e:
+                print(f"Socket handoff aborted, invalid config file {self.config_file}: {e}")
+                return False
+        
+        fd = server_socket.fileno()
+        ready_read, ready_write = os.pipe()
+        env = dict(os.environ, **{LISTEN_FD_ENV: str(fd), READY_FD_ENV: str(ready_write)})
+        try:
+            process = subprocess.Popen([sys.executable] + sys.argv, env=env,
+                                       pass_fds=(fd, ready_write))
+        except (OSError, ValueError) as e:
+            print(f"Socket handoff failed, continuing to serve: {e}")
+            os.close(ready_read)
+            return False
+        finally:
+            os.close(ready_write)
+        
+        # Wait for the ready byte; EOF means the new process exited first
+        try:
+            readable, _, _ = select.select([ready_read], [], [], HANDOFF_TIMEOUT)
+            ready = bool(readable) and os.read(ready_read, 1) == b'1'
+        finally:
+            os.close(ready_read)
+        
+        if not ready:
+            print(f"New process {process.pid} did not report ready, continuing to serve")
+            process.kill()
+            process.wait()
+            return False
+        
+        print(f"Listening socket handed to new process {process.pid}")
+        return True
+    
+    def drain(self, server_socket):
+        """Serve connections already queued on the listening socket.
+        
+        Stops when the queue is empty or after DRAIN_TIMEOUT seconds.
+        """
+        deadline = time.monotonic() + DRAIN_TIMEOUT
+        server_socket.setblocking(False)
+        drained = 0
+        while time.monotonic() < deadline:
+            try:
+                client_conn, client_addr = server_socket.accept()
+            except (BlockingIOError, InterruptedError):
+                break
+            client_conn.setblocking(True)
+            print(f"Draining connection from {client_addr}")
+            self.handle_client(client_conn)
+            drained += 1
+        print(f"Drained {drained} queued connection(s)")
             
     def handle_client(self, client_conn):
         """Handle client connection."""
+        timer = PhaseTimer() if SLOW_REQUEST_THRESHOLD is not None else NULL_TIMER
+        path = None
+        cached_response = None
         try:
             # Receive client request
             request_data = self.receive_all(client_conn)
+            timer.mark('receive_all')
             if not request_data:
                 return
             
             # Parse the HTTP request
-            method, path, headers = self.parse_request(request_data)
-            if not method or not path:
+            request = self.parse_request_head(request_data)
+            timer.mark('parse_request')
+            if request is None:
                 return
+            path, headers = request.path, request.headers
             
             # Extract filename from path for caching purposes
             filename = self.get_filename_from_path(path)
@@ -100,21 +668,26 @@ class LoadBalancer:
             use_cache = False
             if should_cache and os.path.exists(cache_file):
                 print(f"Cache Hit for {cache_key}")
-                # Read cached response and send to client
-                with open(cache_file, 'rb') as f:
-                    cached_response = f.read()
+                # Map cached response and send it, or the requested ranges, to client
+                cached_response = self.map_cache_file(cache_file)
+                timer.mark('cache_open')
                 
                 # Use the cached response
                 use_cache = True
-                client_conn.sendall(cached_response)
+                self.send_cached_response(client_conn, cached_response, request, timer)
                 return
             elif should_cache:
                 print(f"Cache Miss for {cache_key}")
             
             # Check for sticky session cookie
-            backend_server = self.get_backend_from_cookie(headers)
+            backend_server = self.get_backend_from_cookie(headers, request.cookies)
             should_set_cookie = False
             
+            # Backends removed by a config reload are out of rotation, even if still up
+            if backend_server and backend_server not in self.backend_servers:
+                print(f"Sticky backend {backend_server} is no longer configured")
+                backend_server = None
+            
             if backend_server:
                 if self.is_backend_available(backend_server):
                     # Use the backend from the cookie
@@ -130,66 +703,302 @@ class LoadBalancer:
                 selected_backend = self.select_backend_round_robin()
                 should_set_cookie = True
                 print(f"Selected backend (round-robin): {selected_backend}")
+            timer.mark('select_backend')
             
-            # Forward the request to the selected backend
-            response_data = self.forward_request(selected_backend, request_data)
+            # Forward the request to the selected backend and read the response head
+            backend_response = self.forward_request(selected_backend, request_data)
+            timer.mark('forward_request')
 
             # If the response is a timeout, send 504 Gateway Timeout
-            if response_data == b'TIMEOUT':
+            if backend_response == b'TIMEOUT':
                 print(f"Timeout while connecting to backend {selected_backend}")
                 self.send_error(client_conn, 504, "Gateway Timeout")
                 return
             
             # If no response from backend, send 502 Bad Gateway
-            if not response_data:
+            if not backend_response:
                 print(f"No response from backend {selected_backend}, sending 502 Bad Gateway")
                 self.send_error(client_conn, 502, "Bad Gateway")
                 return
             
-            # Check if we need to add a Set-Cookie header
-            if should_set_cookie and response_data:
-                if self.is_success_response(response_data):
+            backend_socket, response_start = backend_response
+            try:
+                is_success = self.is_success_response(response_start)
+                response_segments = [response_start]
+                
+                # Check if we need to add a Set-Cookie header
+                if should_set_cookie and is_success:
                     print(f"Adding sticky session cookie for {selected_backend}")
-                    response_data = self.add_cookie_header(response_data, selected_backend)
+                    response_segments = self.cookie_header_segments(response_start, selected_backend)
                     
                     # Log the modified response headers for debugging
-                    if DEBUG:
-                        try:
-                            headers_end = response_data.find(b'\r\n\r\n')
-                            if headers_end != -1:
-                                headers_str = response_data[:headers_end].decode('utf-8', errors='ignore')
-                                print(f"Modified response headers: {headers_str}")
-                        except Exception as e:
-                            print(f"Error parsing response headers: {e}")
-            
-            # Cache successful responses for cacheable endpoints
-            # if should_cache and response_data and self.is_success_response(response_data):
-            #     with open(cache_file, 'wb') as f:
-            #         f.write(response_data)
-            #     print(f"Response cached to {cache_file}")
-            if should_cache and response_data and self.is_success_response(response_data):
-                try:
-                    # Ensure cache directory exists
-                    os.makedirs(CACHE_DIR, exist_ok=True)
-                    with open(cache_file, 'wb') as f:
-                        f.write(response_data)
-                    print(f"Response cached to {cache_file}")
-                except OSError as e:
-                    # Handle specific cache write errors
-                    if e.errno in (errno.ENOENT, errno.EACCES):
-                        print(f"Cache write error] {e} → skip caching, still 200")
-                    else:
-                        raise
-            
-            # Send response back to client
-            if response_data:
-                client_conn.sendall(response_data)
+                    if DEBUG and len(response_segments) == 3:
+                        headers_str = (bytes(response_segments[0]) + response_segments[1]).decode('utf-8', errors='ignore')
+                        print(f"Modified response headers: {headers_str}")
+                    timer.mark('add_cookie')
+                
+                # Relay the rest of the body as it arrives, caching successful
+                # responses for cacheable endpoints
+                self.stream_response(
+                    client_conn, backend_socket, response_segments,
+                    self.remaining_body_length(response_start),
+                    cache_file if should_cache and is_success else None,
+                    timer
+                )
+            finally:
+                backend_socket.close()
             
         except Exception as e:
             print(f"Error handling client: {e}")
             self.send_error(client_conn, 502, "Bad Gateway")
         finally:
             client_conn.close()
+            if isinstance(cached_response, mmap.mmap):
+                cached_response.close()
+            # Nothing to report for connections without a valid request
+            if path is not None:
+                timer.report_if_slow(path)
+    
+    def map_cache_file(self, cache_file):
+        """Map a cached response into memory instead of reading all of it."""
+        with open(cache_file, 'rb') as f:
+            # Empty files can't be mapped
+            if os.fstat(f.fileno()).st_size == 0:
+                return b''
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    
+    def send_cached_response(self, conn, cached_response, request, timer=NULL_TIMER):
+        """Send a cached full response, or the byte ranges the client asked for.
+        
+        Range bodies are memoryview slices of the cached response, so only
+        the requested bytes are touched.
+        """
+        range_header = request.header('Range')
+        header_end = cached_response.find(HEADER_TERMINATOR)
+        if range_header is None or header_end == -1:
+            self.send_cached_pieces(conn, [cached_response], timer)
+            return
+        
+        status_line, _, header_block = cached_response[:header_end].decode('latin-1').partition('\r\n')
+        cached_headers = []
+        for line in header_block.split('\r\n'):
+            key, sep, value = line.partition(':')
+            if sep:
+                cached_headers.append((key.strip(), value.strip()))
+        validators = {key.lower(): value for key, value in cached_headers}
+        
+        body = memoryview(cached_response)[header_end + len(HEADER_TERMINATOR):]
+        ranges = None
+        if if_range_matches(request.header('If-Range'), validators.get('etag'),
+                            validators.get('last-modified')):
+            ranges = parse_range_header(range_header, len(body))
+        
+        if ranges is None:
+            self.send_cached_pieces(conn, [cached_response], timer)
+            return
+        
+        protocol = status_line.split(' ', 1)[0]
+        if not ranges:
+            print(f"Range not satisfiable: {range_header}")
+            response = f"{protocol} 416 Range Not Satisfiable\r\n"
+            response += f"Content-Range: bytes */{len(body)}\r\n"
+            response += "Content-Length: 0\r\n"
+            response += "Connection: close\r\n\r\n"
+            self.send_cached_pieces(conn, [response.encode()], timer)
+            return
+        
+        content_type = validators.get('content-type', 'application/octet-stream')
+        if len(ranges) == 1:
+            start, end = ranges[0]
+            pieces = [body[start:end + 1]]
+            range_headers = f"Content-Range: bytes {start}-{end}/{len(body)}\r\n"
+        else:
+            boundary = uuid.uuid4().hex
+            pieces = []
+            for start, end in ranges:
+                pieces.append(
+                    f"\r\n--{boundary}\r\nContent-Type: {content_type}\r\n"
+                    f"Content-Range: bytes {start}-{end}/{len(body)}\r\n\r\n".encode()
+                )
+                pieces.append(body[start:end + 1])
+            pieces.append(f"\r\n--{boundary}--\r\n".encode())
+            range_headers = f"Content-Type: multipart/byteranges; boundary={boundary}\r\n"
+        
+        # Keep the cached headers except those describing the full body
+        replaced = {'content-length', 'content-range'}
+        if len(ranges) > 1:
+            replaced.add('content-type')
+        response_header = f"{protocol} 206 Partial Content\r\n"
+        for key, value in cached_headers:
+            if key.lower() not in replaced:
+                response_header += f"{key}: {value}\r\n"
+        response_header += range_headers
+        response_header += f"Content-Length: {sum(len(piece) for piece in pieces)}\r\n\r\n"
+        
+        print(f"Serving {len(ranges)} range(s) from cache: {range_header}")
+        self.send_cached_pieces(conn, [response_header.encode()] + pieces, timer)
+    
+    def send_cached_pieces(self, conn, pieces, timer=NULL_TIMER):
+        """Send pieces of a mapped cache file, timing reading and sending apart.
+        
+        Each chunk is copied into a reused buffer before it is sent, so the
+        page-in cost of the cache file is recorded as cache_read rather than
+        hidden inside sendall.
+        """
+        buffer = bytearray(STREAM_BUFFER_SIZE)
+        view = memoryview(buffer)
+        read_time = send_time = 0.0
+        try:
+            for piece in pieces:
+                piece = memoryview(piece)
+                for offset in range(0, len(piece), STREAM_BUFFER_SIZE):
+                    started = time.perf_counter()
+                    chunk = piece[offset:offset + STREAM_BUFFER_SIZE]
+                    view[:len(chunk)] = chunk
+                    read = time.perf_counter()
+                    conn.sendall(view[:len(chunk)])
+                    read_time += read - started
+                    send_time += time.perf_counter() - read
+        finally:
+            timer.add_phases([('cache_read', read_time), ('sendall', send_time)])
+    
+    def stream_response(self, client_conn, backend_socket, response_segments, remaining,
+                        cache_file=None, timer=NULL_TIMER):
+        """Relay a backend response to the client as it arrives.
+        
+        `response_segments` (the response head and any body bytes read with
+        it) are sent first, then `remaining` more body bytes, or everything
+        until the backend closes if `remaining` is None, are copied from
+        backend_socket. If `cache_file` is given the same bytes go to a
+        temporary file, which replaces `cache_file` only once the whole
+        response has been received. Time spent reading the backend, sending
+        to the client and writing the cache is added to `timer` as the
+        backend_recv, sendall and cache_write phases. Returns True if the
+        response was complete.
+        """
+        recv_time = send_time = cache_time = 0.0
+        started = time.perf_counter()
+        cache_tmp = self.open_cache_tmp() if cache_file else None
+        cache_time += time.perf_counter() - started
+        streamed = 0
+        complete = False
+        try:
+            started = time.perf_counter()
+            self.send_segments(client_conn, response_segments)
+            sent = time.perf_counter()
+            cache_tmp = self.write_cache_tmp(cache_tmp, response_segments)
+            send_time += sent - started
+            cache_time += time.perf_counter() - sent
+            
+            buffer = bytearray(STREAM_BUFFER_SIZE)
+            view = memoryview(buffer)
+            while remaining is None or streamed < remaining:
+                wanted = STREAM_BUFFER_SIZE if remaining is None else min(STREAM_BUFFER_SIZE, remaining - streamed)
+                started = time.perf_counter()
+                received = backend_socket.recv_into(buffer, wanted)
+                received_at = time.perf_counter()
+                recv_time += received_at - started
+                if not received:
+                    break
+                client_conn.sendall(view[:received])
+                sent = time.perf_counter()
+                cache_tmp = self.write_cache_tmp(cache_tmp, [view[:received]])
+                send_time += sent - received_at
+                cache_time += time.perf_counter() - sent
+                streamed += received
+            
+            complete = remaining is None or streamed >= remaining
+            if not complete:
+                print(f"Backend closed after {streamed} of {remaining} remaining body bytes")
+        except socket.timeout:
+            print("Timeout while streaming response from backend")
+        except OSError as e:
+            print(f"Error streaming response: {e}")
+        finally:
+            started = time.perf_counter()
+            if cache_tmp is not None:
+                self.finish_cache_tmp(cache_tmp, cache_file, complete)
+            cache_time += time.perf_counter() - started
+            
+            phases = [('backend_recv', recv_time), ('sendall', send_time)]
+            if cache_file:
+                phases.append(('cache_write', cache_time))
+            timer.add_phases(phases)
+        return complete
+    
+    def remaining_body_length(self, response_start):
+        """Body bytes still expected after `response_start`, None without Content-Length."""
+        header_end = response_start.find(HEADER_TERMINATOR)
+        if header_end == -1:
+            return None
+        for line in response_start[:header_end].split(b'\r\n')[1:]:
+            key, sep, value = line.partition(b':')
+            if sep and key.strip().lower() == b'content-length':
+                try:
+                    content_length = int(value.strip())
+                except ValueError:
+                    return None
+                received = len(response_start) - header_end - len(HEADER_TERMINATOR)
+                return max(content_length - received, 0)
+        return None
+    
+    def open_cache_tmp(self):
+        """Open a temporary file in CACHE_DIR for a response that is being cached.
+        
+        Returns (file, path), or None if the cache directory can't be written.
+        """
+        try:
+            # Ensure cache directory exists
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, suffix='.tmp')
+        except OSError as e:
+            # Handle specific cache write errors
+            if e.errno in (errno.ENOENT, errno.EACCES):
+                print(f"Cache write error] {e} → skip caching, still 200")
+                return None
+            raise
+        return os.fdopen(fd, 'wb'), tmp_path
+    
+    def write_cache_tmp(self, cache_tmp, segments):
+        """Append segments to a temporary cache file.
+        
+        Returns the cache_tmp to keep using, or None if writing failed and the
+        file was discarded. The client response carries on either way.
+        """
+        if cache_tmp is None:
+            return None
+        f, tmp_path = cache_tmp
+        try:
+            f.writelines(segments)
+            return cache_tmp
+        except OSError as e:
+            print(f"Cache write error] {e} → skip caching, still 200")
+            self.discard_cache_tmp(cache_tmp)
+            return None
+    
+    def finish_cache_tmp(self, cache_tmp, cache_file, complete):
+        """Move a complete temporary cache file into place, or discard it."""
+        if not complete:
+            print(f"Incomplete response, not caching {cache_file}")
+            self.discard_cache_tmp(cache_tmp)
+            return
+        f, tmp_path = cache_tmp
+        try:
+            f.close()
+            os.replace(tmp_path, cache_file)
+            print(f"Response cached to {cache_file}")
+        except OSError as e:
+            print(f"Cache write error] {e} → skip caching, still 200")
+            self.discard_cache_tmp(cache_tmp)
+    
+    def discard_cache_tmp(self, cache_tmp):
+        """Close and remove a temporary cache file."""
+        f, tmp_path = cache_tmp
+        try:
+            f.close()
+            os.remove(tmp_path)
+        except OSError as e:
+            print(f"Error removing temporary cache file {tmp_path}: {e}")
     
     def should_cache_endpoint(self, path):
         """Determine if an endpoint should be cached."""
@@ -199,7 +1008,9 @@ class LoadBalancer:
     def receive_all(self, conn):
         """Receive all data from the connection."""
         conn.settimeout(TIMEOUT)
-        data = b''
+        # A bytearray grows in place, `bytes +=` would copy everything per chunk
+        data = bytearray()
+        head = None
         try:
             while True:
                 chunk = conn.recv(BUFFER_SIZE)
@@ -207,11 +1018,13 @@ class LoadBalancer:
                     break
                 data += chunk
                 # If we've received the full HTTP headers and no body is expected
-                if b'\r\n\r\n' in data and not (
-                    b'Content-Length:' in data or 
-                    b'Transfer-Encoding: chunked' in data
-                ):
-                    break
+                if head is None:
+                    header_end = data.find(HEADER_TERMINATOR)
+                    if header_end == -1:
+                        continue
+                    head = bytes(data[:header_end])
+                    if not (b'Content-Length:' in head or b'Transfer-Encoding: chunked' in head):
+                        break
         except socket.timeout:
             print("Socket timeout while receiving data")
             # Return a special bytes value instead of string
@@ -219,44 +1032,27 @@ class LoadBalancer:
         except Exception as e:
             print(f"Error receiving data: {e}")
             return None
-        return data
+        return bytes(data)
     
-    def parse_request(self, request_data):
-        """Parse the HTTP request into method, path, and headers."""
+    def parse_request_head(self, request_data):
+        """Parse the request line, headers and cookies into an HTTPRequest."""
         try:
-            request_text = request_data.decode('utf-8', errors='ignore')
-            request_lines = request_text.split('\r\n')
-            
+            request = HTTPRequest.parse(request_data)
             if DEBUG:
-                print(f"Request first line: {request_lines[0] if request_lines else 'No request lines'}")
-            
-            if not request_lines:
-                return None, None, {}
-                
-            request_line = request_lines[0].split()
-            
-            if len(request_line) < 3:
-                return None, None, {}
-            
-            method, request_uri, protocol = request_line
-            
-            # Parse headers
-            headers = {}
-            for line in request_lines[1:]:
-                if not line:
-                    break
-                if ':' in line:
-                    key, value = line.split(':', 1)
-                    headers[key.strip()] = value.strip()
-            
-            # Extract path
-            parsed_url = urlparse(request_uri)
-            path = parsed_url.path if parsed_url.path else '/'
-            
-            return method, path, headers
+                line_end = request_data.find(b'\r\n')
+                first_line = request_data[:line_end] if line_end != -1 else request_data
+                print(f"Request first line: {first_line.decode('utf-8', errors='ignore') or 'No request lines'}")
+            return request
         except Exception as e:
             print(f"Error parsing request: {e}")
+            return None
+    
+    def parse_request(self, request_data):
+        """Parse the HTTP request into method, path, and headers."""
+        request = self.parse_request_head(request_data)
+        if request is None:
             return None, None, {}
+        return request.method, request.path, request.headers
     
     def get_filename_from_path(self, path):
         """Extract filename from path for caching purposes."""
@@ -270,31 +1066,39 @@ class LoadBalancer:
         
         return normalized.replace('/', '_')
     
-    def get_backend_from_cookie(self, headers):
+    def get_backend_from_cookie(self, headers, cookies=None):
         """Extract backend server from cookie header."""
-        if 'Cookie' not in headers:
-            print("No Cookie header found") if DEBUG else None
+        if cookies is None:
+            if 'Cookie' not in headers:
+                print("No Cookie header found") if DEBUG else None
+                return None
+            cookies = parse_cookie_header(headers['Cookie'])
+        if DEBUG:
+            print(f"Parsed cookies: {cookies}")
+        
+        value = cookies.get(STICKY_COOKIE_NAME)
+        if value is None:
+            print(f"Cookie {STICKY_COOKIE_NAME} not found in cookies") if DEBUG else None
             return None
         
-        cookies = headers['Cookie'].split(';')
-        for cookie in cookies:
-            cookie = cookie.strip()
-            if DEBUG:
-                print(f"Processing cookie: {cookie}")
-                
-            if cookie.startswith(f"{STICKY_COOKIE_NAME}="):
-                value = cookie[len(f"{STICKY_COOKIE_NAME}="):]
-                try:
-                    host, port_str = value.split(':')
-                    backend = (host, int(port_str))
-                    print(f"Found backend in cookie: {backend}") if DEBUG else None
-                    return backend
-                except Exception as e:
-                    print(f"Error parsing backend from cookie: {e}, value: {value}") if DEBUG else None
-                    return None
+        backend = self.cookie_backends.get(value)
+        if backend is not None:
+            print(f"Found backend in cookie: {backend}") if DEBUG else None
+            return backend
         
-        print(f"Cookie {STICKY_COOKIE_NAME} not found in cookies") if DEBUG else None
-        return None
+        try:
+            host, port_str = value.split(':')
+            backend = (sys.intern(host), int(port_str))
+        except Exception as e:
+            print(f"Error parsing backend from cookie: {e}, value: {value}") if DEBUG else None
+            return None
+        
+        # Bound the cache, cookie values are client controlled
+        if len(self.cookie_backends) >= COOKIE_CACHE_SIZE:
+            self.cookie_backends.clear()
+        self.cookie_backends[sys.intern(value)] = backend
+        print(f"Found backend in cookie: {backend}") if DEBUG else None
+        return backend
     
     def is_backend_available(self, backend):
         """Check if backend server is available."""
@@ -326,8 +1130,15 @@ class LoadBalancer:
         return self.backend_servers[0]
     
     def forward_request(self, backend, request_data):
-        """Forward the request to the backend server."""
+        """Forward the request to the backend server and read the response head.
+        
+        Returns (backend_socket, response_start) where response_start holds the
+        response headers and any body bytes received with them; the caller
+        streams the rest of the body from backend_socket and closes it.
+        Returns b'TIMEOUT' on a timeout and None on any other failure.
+        """
         host, port = backend
+        backend_socket = None
         try:
             # Connect to backend server
             backend_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
@@ -338,70 +1149,100 @@ class LoadBalancer:
             backend_socket.sendall(request_data)
             print(f"Request forwarded to backend {host}:{port}")
             
-            # Get response
-            response_data = self.receive_all(backend_socket)
-            backend_socket.close()
+            # Get the response headers, the body is streamed by the caller
+            response_start = bytearray()
+            while HEADER_TERMINATOR not in response_start and len(response_start) < MAX_RESPONSE_HEAD:
+                chunk = backend_socket.recv(STREAM_BUFFER_SIZE)
+                if not chunk:
+                    break
+                response_start += chunk
             
-            if response_data and response_data != b'TIMEOUT':
-                print(f"Received response from backend {host}:{port}")
-                
-                # Debug response status
-                if DEBUG:
-                    try:
-                        status_line = response_data.split(b'\r\n')[0].decode('utf-8', errors='ignore')
-                        print(f"Response status: {status_line}")
-                    except:
-                        pass
-            elif response_data == b'TIMEOUT':
-                print(f"Connection to backend {host}:{port} timed out")
-                return b'TIMEOUT'
-            else:
+            if not response_start:
                 print(f"No response from backend {host}:{port}")
-                
-            return response_data
+                backend_socket.close()
+                return None
+            
+            print(f"Received response from backend {host}:{port}")
+            response_start = bytes(response_start)
+            
+            # Debug response status
+            if DEBUG:
+                status_line = status_line_of(response_start).decode('utf-8', errors='ignore')
+                print(f"Response status: {status_line}")
+            
+            return backend_socket, response_start
         except socket.timeout:
             print(f"Connection to backend {host}:{port} timed out")
-            return None
+            backend_socket.close()
+            return b'TIMEOUT'
         except Exception as e:
             print(f"Error forwarding request to backend {host}:{port}: {e}")
+            if backend_socket is not None:
+                backend_socket.close()
             return None
     
     def is_success_response(self, response_data):
         """Check if the response is successful (200 OK)."""
         try:
-            if isinstance(response_data, dict) or not isinstance(response_data, bytes):
+            if not isinstance(response_data, bytes):
                 return False
-            status_line = response_data.split(b'\r\n')[0].decode('utf-8', errors='ignore')
-            return '200 OK' in status_line
+            return b'200 OK' in status_line_of(response_data)
         except Exception as e:
             print(f"Error checking response status: {e}")
             return False
     
+    def cookie_header_segments(self, response_data, backend):
+        """Split the response into buffers with a Set-Cookie line injected.
+        
+        Returns [header prefix, Set-Cookie line, blank line + body] where the
+        first and last segments are memoryviews of `response_data`, so the
+        body is never copied. Returns [response_data] if there is no header block.
+        """
+        header_end = response_data.find(HEADER_TERMINATOR)
+        if header_end == -1:
+            return [response_data]
+        
+        cookie_line = self.cookie_lines.get(backend)
+        if cookie_line is None:
+            host, port = backend
+            cookie_line = f"Set-Cookie: {STICKY_COOKIE_NAME}={host}:{port}; Path=/\r\n".encode()
+            self.cookie_lines[backend] = cookie_line
+        
+        if DEBUG:
+            existing_headers = response_data[:header_end].decode('utf-8', errors='ignore')
+            print(f"Existing headers: {existing_headers}")
+            print(f"Adding cookie header: {cookie_line.decode().strip()}")
+        
+        # Split after the CRLF of the last header line
+        split_at = header_end + 2
+        view = memoryview(response_data)
+        return [view[:split_at], cookie_line, view[split_at:]]
+    
     def add_cookie_header(self, response_data, backend):
         """Add Set-Cookie header to the response."""
         try:
-            host, port = backend
-            backend_str = f"{host}:{port}"
-            cookie_header = f"Set-Cookie: {STICKY_COOKIE_NAME}={backend_str}; Path=/\r\n"
-            
-            # Insert cookie header before the blank line separating headers and body
-            header_end = response_data.find(b'\r\n\r\n')
-            if header_end != -1:
-                # Extract existing headers for debugging
-                if DEBUG:
-                    existing_headers = response_data[:header_end].decode('utf-8', errors='ignore')
-                    print(f"Existing headers: {existing_headers}")
-                    print(f"Adding cookie header: {cookie_header.strip()}")
-                
-                new_response = response_data[:header_end] + \
-                              f"\r\n{cookie_header}".encode() + \
-                              response_data[header_end:]
-                return new_response
-            return response_data
+            return b''.join(self.cookie_header_segments(response_data, backend))
         except Exception as e:
             print(f"Error adding cookie header: {e}")
             return response_data
     
+    def send_segments(self, conn, segments):
+        """Send a list of buffers using vectored I/O where available."""
+        if not hasattr(conn, 'sendmsg'):
+            for segment in segments:
+                conn.sendall(segment)
+            return
+        
+        buffers = [memoryview(segment) for segment in segments if len(segment)]
+        while buffers:
+            sent = conn.sendmsg(buffers)
+            # Drop fully sent buffers and trim a partially sent one
+            while buffers and sent >= len(buffers[0]):
+                sent -= len(buffers[0])
+                buffers.pop(0)
+            if sent:
+                buffers[0] = buffers[0][sent:]
+    
     def send_error(self, conn, code, message):
         """Send an error response to the client."""
         try:
@@ -434,5 +1275,12 @@ class LoadBalancer:
 
 
 if __name__ == '__main__':
-    lb = LoadBalancer(HOST, PORT, BACKEND_SERVERS)
+    if os.path.exists(CONFIG_FILE):
+        try:
+            apply_config(load_config(CONFIG_FILE))
+        except (OSError, ValueError) as e:
+            print(f"Invalid config file {CONFIG_FILE}: {e}")
+            sys.exit(1)
+    
+    lb = LoadBalancer(HOST, PORT, BACKEND_SERVERS, CONFIG_FILE)
     lb.start()
\ No newline at end of file